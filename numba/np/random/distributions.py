@@ -60,98 +60,208 @@ else:
         return np.exp(x) - 1.0
 
 
+# The ziggurat based distributions below are split into a fast path, which
+# accepts the vast majority of draws from a single BitGenerator call, and a
+# "slow" function handling the tail and the wedges of the ziggurat. The fast
+# functions return whether the draw was accepted along with the ziggurat
+# layer, the random bits and the candidate value needed by the slow
+# functions, which in turn return whether the draw was accepted along with
+# its value. When it is rejected the draw starts over from the fast path.
+#
+# The `_fill` variants write a whole 1-D array of draws, consuming the
+# BitGenerator exactly as repeated calls to the scalar functions would.
+
+
+@register_jitable
+def random_standard_normal_slow(bitgen, idx, rabs, x):
+    if idx == 0:
+        while 1:
+            xx = -ziggurat_nor_inv_r * np.log1p(-next_double(bitgen))
+            yy = -np.log1p(-next_double(bitgen))
+            if (yy + yy > xx * xx):
+                if ((rabs >> 8) & 0x1):
+                    return True, -(ziggurat_nor_r + xx)
+                else:
+                    return True, ziggurat_nor_r + xx
+    else:
+        if (((fi_double[idx - 1] - fi_double[idx]) *
+                next_double(bitgen) + fi_double[idx]) <
+                np.exp(-0.5 * x * x)):
+            return True, x
+    return False, x
+
+
+@register_jitable
+def random_standard_normal_fast(bitgen):
+    r = next_uint64(bitgen)
+    idx = r & 0xff
+    r >>= 8
+    sign = r & 0x1
+    rabs = (r >> 1) & 0x000fffffffffffff
+    x = rabs * wi_double[idx]
+    if (sign & 0x1):
+        x = -x
+    return rabs < ki_double[idx], idx, rabs, x
+
+
 @register_jitable
 def random_standard_normal(bitgen):
     while 1:
-        r = next_uint64(bitgen)
-        idx = r & 0xff
-        r >>= 8
-        sign = r & 0x1
-        rabs = (r >> 1) & 0x000fffffffffffff
-        x = rabs * wi_double[idx]
-        if (sign & 0x1):
-            x = -x
-        if rabs < ki_double[idx]:
+        accepted, idx, rabs, x = random_standard_normal_fast(bitgen)
+        if accepted:
+            return x
+        accepted, x = random_standard_normal_slow(bitgen, idx, rabs, x)
+        if accepted:
             return x
-        if idx == 0:
-            while 1:
-                xx = -ziggurat_nor_inv_r * np.log1p(-next_double(bitgen))
-                yy = -np.log1p(-next_double(bitgen))
-                if (yy + yy > xx * xx):
-                    if ((rabs >> 8) & 0x1):
-                        return -(ziggurat_nor_r + xx)
-                    else:
-                        return ziggurat_nor_r + xx
-        else:
-            if (((fi_double[idx - 1] - fi_double[idx]) *
-                    next_double(bitgen) + fi_double[idx]) <
-                    np.exp(-0.5 * x * x)):
-                return x
+
+
+@register_jitable
+def random_standard_normal_fill(bitgen, out):
+    for i in range(out.size):
+        accepted, idx, rabs, x = random_standard_normal_fast(bitgen)
+        if not accepted:
+            accepted, x = random_standard_normal_slow(bitgen, idx, rabs, x)
+            if not accepted:
+                x = random_standard_normal(bitgen)
+        out[i] = x
+
+
+@register_jitable
+def random_standard_normal_slow_f(bitgen, idx, rabs, x):
+    if (idx == 0):
+        while 1:
+            xx = float32(-ziggurat_nor_inv_r_f *
+                         np_log1pf(-next_float(bitgen)))
+            yy = float32(-np_log1pf(-next_float(bitgen)))
+            if (float32(yy + yy) > float32(xx * xx)):
+                if ((rabs >> 8) & 0x1):
+                    return True, -float32(ziggurat_nor_r_f + xx)
+                else:
+                    return True, float32(ziggurat_nor_r_f + xx)
+    else:
+        if (((fi_float[idx - 1] - fi_float[idx]) * next_float(bitgen) +
+             fi_float[idx]) < float32(np.exp(-float32(0.5) * x * x))):
+            return True, x
+    return False, x
+
+
+@register_jitable
+def random_standard_normal_fast_f(bitgen):
+    r = next_uint32(bitgen)
+    idx = r & 0xff
+    sign = (r >> 8) & 0x1
+    rabs = (r >> 9) & 0x0007fffff
+    x = float32(float32(rabs) * wi_float[idx])
+    if (sign & 0x1):
+        x = -x
+    return rabs < ki_float[idx], idx, rabs, x
 
 
 @register_jitable
 def random_standard_normal_f(bitgen):
     while 1:
-        r = next_uint32(bitgen)
-        idx = r & 0xff
-        sign = (r >> 8) & 0x1
-        rabs = (r >> 9) & 0x0007fffff
-        x = float32(float32(rabs) * wi_float[idx])
-        if (sign & 0x1):
-            x = -x
-        if (rabs < ki_float[idx]):
+        accepted, idx, rabs, x = random_standard_normal_fast_f(bitgen)
+        if accepted:
             return x
-        if (idx == 0):
-            while 1:
-                xx = float32(-ziggurat_nor_inv_r_f *
-                             np_log1pf(-next_float(bitgen)))
-                yy = float32(-np_log1pf(-next_float(bitgen)))
-                if (float32(yy + yy) > float32(xx * xx)):
-                    if ((rabs >> 8) & 0x1):
-                        return -float32(ziggurat_nor_r_f + xx)
-                    else:
-                        return float32(ziggurat_nor_r_f + xx)
-        else:
-            if (((fi_float[idx - 1] - fi_float[idx]) * next_float(bitgen) +
-                 fi_float[idx]) < float32(np.exp(-float32(0.5) * x * x))):
-                return x
+        accepted, x = random_standard_normal_slow_f(bitgen, idx, rabs, x)
+        if accepted:
+            return x
+
+
+@register_jitable
+def random_standard_normal_fill_f(bitgen, out):
+    for i in range(out.size):
+        accepted, idx, rabs, x = random_standard_normal_fast_f(bitgen)
+        if not accepted:
+            accepted, x = random_standard_normal_slow_f(bitgen, idx, rabs, x)
+            if not accepted:
+                x = random_standard_normal_f(bitgen)
+        out[i] = x
+
+
+@register_jitable
+def random_standard_exponential_slow(bitgen, idx, x):
+    if idx == 0:
+        return True, ziggurat_exp_r - np_log1p(-next_double(bitgen))
+    elif ((fe_double[idx - 1] - fe_double[idx]) * next_double(bitgen) +
+          fe_double[idx] < np.exp(-x)):
+        return True, x
+    return False, x
+
+
+@register_jitable
+def random_standard_exponential_fast(bitgen):
+    ri = next_uint64(bitgen)
+    ri >>= 3
+    idx = ri & 0xFF
+    ri >>= 8
+    x = ri * we_double[idx]
+    return ri < ke_double[idx], idx, ri, x
 
 
 @register_jitable
 def random_standard_exponential(bitgen):
     while 1:
-        ri = next_uint64(bitgen)
-        ri >>= 3
-        idx = ri & 0xFF
-        ri >>= 8
-        x = ri * we_double[idx]
-        if (ri < ke_double[idx]):
+        accepted, idx, ri, x = random_standard_exponential_fast(bitgen)
+        if accepted:
+            return x
+        accepted, x = random_standard_exponential_slow(bitgen, idx, x)
+        if accepted:
             return x
-        else:
-            if idx == 0:
-                return ziggurat_exp_r - np_log1p(-next_double(bitgen))
-            elif ((fe_double[idx - 1] - fe_double[idx]) * next_double(bitgen) +
-                  fe_double[idx] < np.exp(-x)):
-                return x
+
+
+@register_jitable
+def random_standard_exponential_fill(bitgen, out):
+    for i in range(out.size):
+        accepted, idx, ri, x = random_standard_exponential_fast(bitgen)
+        if not accepted:
+            accepted, x = random_standard_exponential_slow(bitgen, idx, x)
+            if not accepted:
+                x = random_standard_exponential(bitgen)
+        out[i] = x
+
+
+@register_jitable
+def random_standard_exponential_slow_f(bitgen, idx, x):
+    if (idx == 0):
+        return True, float32(ziggurat_exp_r_f -
+                             float32(np_log1pf(-next_float(bitgen))))
+    elif ((fe_float[idx - 1] - fe_float[idx]) * next_float(bitgen) +
+          fe_float[idx] < float32(np.exp(float32(-x)))):
+        return True, x
+    return False, x
+
+
+@register_jitable
+def random_standard_exponential_fast_f(bitgen):
+    ri = next_uint32(bitgen)
+    ri >>= 1
+    idx = ri & 0xFF
+    ri >>= 8
+    x = float32(float32(ri) * we_float[idx])
+    return ri < ke_float[idx], idx, ri, x
 
 
 @register_jitable
 def random_standard_exponential_f(bitgen):
     while 1:
-        ri = next_uint32(bitgen)
-        ri >>= 1
-        idx = ri & 0xFF
-        ri >>= 8
-        x = float32(float32(ri) * we_float[idx])
-        if (ri < ke_float[idx]):
+        accepted, idx, ri, x = random_standard_exponential_fast_f(bitgen)
+        if accepted:
             return x
-        else:
-            if (idx == 0):
-                return float32(ziggurat_exp_r_f -
-                               float32(np_log1pf(-next_float(bitgen))))
-            elif ((fe_float[idx - 1] - fe_float[idx]) * next_float(bitgen) +
-                  fe_float[idx] < float32(np.exp(float32(-x)))):
-                return x
+        accepted, x = random_standard_exponential_slow_f(bitgen, idx, x)
+        if accepted:
+            return x
+
+
+@register_jitable
+def random_standard_exponential_fill_f(bitgen, out):
+    for i in range(out.size):
+        accepted, idx, ri, x = random_standard_exponential_fast_f(bitgen)
+        if not accepted:
+            accepted, x = random_standard_exponential_slow_f(bitgen, idx, x)
+            if not accepted:
+                x = random_standard_exponential_f(bitgen)
+        out[i] = x
 
 
 @register_jitable
@@ -13,6 +13,8 @@ from numba.core.types.containers import Tuple, UniTuple
 from numba.np.random.distributions import \
     (random_standard_exponential_inv_f, random_standard_exponential_inv,
      random_standard_exponential, random_standard_normal_f,
+     random_standard_exponential_fill, random_standard_exponential_fill_f,
+     random_standard_normal_fill, random_standard_normal_fill_f,
      random_standard_gamma, random_standard_normal, random_uniform,
      random_standard_exponential_f, random_standard_gamma_f, random_normal,
      random_exponential, random_gamma, random_beta, random_power,
@@ -23,15 +25,19 @@ from numba.np.random.distributions import \
      random_poisson, random_negative_binomial, random_logseries,
      random_noncentral_chisquare, random_noncentral_f)
 from numba.np.random import random_methods
+from numba.np.random.random_methods import (random_bounded,
+                                            random_bounded_fill)
 
 
-def _get_proper_func(func_32, func_64, dtype, dist_name="the given"):
-    """
-        Most of the standard NumPy distributions that accept dtype argument
-        only support either np.float32 or np.float64 as dtypes.
+_float_dtypes = (np.float32, np.float64)
+_int_dtypes = (np.int32, np.int64)
 
-        This is a helper function that helps Numba select the proper underlying
-        implementation according to provided dtype.
+
+def _get_dtype(dtype, allowed):
+    """
+        Returns the Numba type for the dtype argument of the distributions
+        that only support the NumPy dtypes in `allowed`, along with the
+        matching NumPy dtype.
     """
     if isinstance(dtype, types.Omitted):
         dtype = dtype.value
@@ -43,10 +49,28 @@ def _get_proper_func(func_32, func_64, dtype, dist_name="the given"):
         nb_dt = dtype
         np_dt = as_dtype(nb_dt)
 
-    if np_dt not in [np.float32, np.float64]:
+    if np_dt not in allowed:
         raise TypingError("Argument dtype is not one of the" +
                           " expected type(s): " +
-                          " np.float32 or np.float64")
+                          " " + " or ".join("np." + dt.__name__
+                                            for dt in allowed))
+
+    return nb_dt, np_dt
+
+
+def _get_proper_func(func_32, func_64, dtype, dist_name="the given"):
+    """
+        Most of the standard NumPy distributions that accept dtype argument
+        only support either np.float32 or np.float64 as dtypes.
+
+        This is a helper function that helps Numba select the proper underlying
+        implementation according to provided dtype.
+
+        Distributions with several implementations may pass tuples of
+        matching functions as `func_32` and `func_64`, the tuple for the
+        provided dtype is then returned.
+    """
+    nb_dt, np_dt = _get_dtype(dtype, _float_dtypes)
 
     if np_dt == np.float32:
         next_func = func_32
@@ -57,10 +81,10 @@ def _get_proper_func(func_32, func_64, dtype, dist_name="the given"):
 
 
 def check_size(size):
-    if not any([isinstance(size, UniTuple) and
-                isinstance(size.dtype, types.Integer),
-                isinstance(size, Tuple) and size.count == 0,
-                isinstance(size, types.Integer)]):
+    if not (isinstance(size, types.Integer) or
+            (isinstance(size, UniTuple) and
+             isinstance(size.dtype, types.Integer)) or
+            (isinstance(size, Tuple) and size.count == 0)):
         raise TypingError("Argument size is not one of the" +
                           " expected type(s): " +
                           " an integer, an empty tuple or a tuple of integers")
@@ -77,13 +101,41 @@ def check_types(obj, type_list, arg_name):
     if not isinstance(type_list, (list, tuple)):
         type_list = [type_list]
 
-    if not any([isinstance(obj, _type) for _type in type_list]):
+    if not isinstance(obj, tuple(type_list)):
         raise TypingError(f"Argument {arg_name} is not one of the" +
                           f" expected type(s): {type_list}")
 
 
+@register_jitable
+def _fill(out, bitgen, dist_func, *args):
+    """
+    Fills the array `out` with independent draws of `dist_func(bitgen, *args)`.
+
+    The draws are assigned in C order through a 1-D view, as `out` is
+    always a freshly allocated C-contiguous array.
+    """
+    out_f = out.ravel()
+    for i in range(out_f.size):
+        out_f[i] = dist_func(bitgen, *args)
+
+
+def _get_literal_value(obj):
+    """
+    Returns the value of an argument that is known at compile time,
+    i.e. an omitted argument or a literal, otherwise returns None.
+    """
+    if isinstance(obj, types.Omitted):
+        return obj.value
+    if isinstance(obj, (types.IntegerLiteral, types.BooleanLiteral)):
+        return obj.literal_value
+    if isinstance(obj, (bool, int)):
+        return obj
+    return None
+
+
 # Overload the Generator().integers()
-@overload_method(types.NumPyRandomGeneratorType, 'integers')
+@overload_method(types.NumPyRandomGeneratorType, 'integers',
+                 prefer_literal=True)
 def NumPyRandomGeneratorType_integers(inst, low, high, size=None,
                                       dtype=np.int64, endpoint=False):
     check_types(low, [types.Integer,
@@ -98,37 +150,65 @@ def NumPyRandomGeneratorType_integers(inst, low, high, size=None,
     if isinstance(dtype, types.Omitted):
         dtype = dtype.value
 
+    # Raises a TypingError for unsupported dtypes
+    random_methods._get_bounded_funcs(dtype)
     if isinstance(dtype, type):
-        nb_dt = from_dtype(np.dtype(dtype))
         _dtype = dtype
-    elif isinstance(dtype, types.NumberClass):
-        nb_dt = dtype
-        _dtype = as_dtype(nb_dt)
     else:
-        raise TypingError("Argument dtype is not one of the" +
-                          " expected type(s): " +
-                          "np.int32, np.int64, np.int16, np.int8, "
-                          "np.uint32, np.uint64, np.uint16, np.uint8, "
-                          "np.bool_")
+        _dtype = as_dtype(dtype)
 
     if _dtype == np.bool_:
-        int_func = random_methods.random_bounded_bool_fill
         lower_bound = -1
         upper_bound = 2
     else:
-        try:
-            i_info = np.iinfo(_dtype)
-        except ValueError:
-            raise TypingError("Argument dtype is not one of the" +
-                              " expected type(s): " +
-                              "np.int32, np.int64, np.int16, np.int8, "
-                              "np.uint32, np.uint64, np.uint16, np.uint8, "
-                              "np.bool_")
-        int_func = getattr(random_methods,
-                           f'random_bounded_uint{i_info.bits}_fill')
+        i_info = np.iinfo(_dtype)
         lower_bound = i_info.min
         upper_bound = i_info.max
 
+        # When the bounds are compile time constants the argument check,
+        # the casts and the range are all computed here, only the draws
+        # are left to the impl. Invalid bounds fall through to the generic
+        # impl so that the error is raised at runtime, as it is in NumPy.
+        literal_args = [_get_literal_value(arg)
+                        for arg in (low, high, endpoint)]
+        if not any(arg is None for arg in literal_args):
+            _low, _high, _endpoint = literal_args
+            try:
+                random_methods._randint_arg_check(_low, _high, _endpoint,
+                                                  lower_bound, upper_bound)
+            except (ValueError, OverflowError):
+                valid_bounds = False
+            else:
+                if not _endpoint:
+                    _high -= 1
+                # The range is converted to an unsigned integer below, an
+                # empty interval is left to the generic impl as well.
+                valid_bounds = _high >= _low
+
+            if valid_bounds:
+                const_low = np.dtype(_dtype).type(_low)
+                # The range has the type of `high - low` in the generic
+                # impl, which is a 64 bit integer of the same signedness.
+                const_rng = np.uint64(_high - _low)
+                if i_info.kind == 'i':
+                    const_rng = const_rng.astype(np.int64)
+
+                if is_nonelike(size):
+                    def impl(inst, low, high, size=None,
+                             dtype=np.int64, endpoint=False):
+                        return random_bounded(inst.bit_generator, const_low,
+                                              const_rng, dtype)
+                    return impl
+                else:
+                    check_size(size)
+
+                    def impl(inst, low, high, size=None,
+                             dtype=np.int64, endpoint=False):
+                        return random_bounded_fill(inst.bit_generator,
+                                                   const_low, const_rng,
+                                                   size, dtype)
+                    return impl
+
     if is_nonelike(size):
         def impl(inst, low, high, size=None,
                  dtype=np.int64, endpoint=False):
@@ -139,12 +219,12 @@ def NumPyRandomGeneratorType_integers(inst, low, high, size=None,
                 low = dtype(low)
                 high = dtype(high)
                 rng = high - low
-                return int_func(inst.bit_generator, low, rng, 1, dtype)[0]
+                return random_bounded(inst.bit_generator, low, rng, dtype)
             else:
                 low = dtype(low)
                 high = dtype(high)
                 rng = high - low
-                return int_func(inst.bit_generator, low, rng, 1, dtype)[0]
+                return random_bounded(inst.bit_generator, low, rng, dtype)
         return impl
     else:
         check_size(size)
@@ -158,12 +238,14 @@ def NumPyRandomGeneratorType_integers(inst, low, high, size=None,
                 low = dtype(low)
                 high = dtype(high)
                 rng = high - low
-                return int_func(inst.bit_generator, low, rng, size, dtype)
+                return random_bounded_fill(inst.bit_generator, low, rng,
+                                           size, dtype)
             else:
                 low = dtype(low)
                 high = dtype(high)
                 rng = high - low
-                return int_func(inst.bit_generator, low, rng, size, dtype)
+                return random_bounded_fill(inst.bit_generator, low, rng,
+                                           size, dtype)
         return impl
 
 
@@ -176,6 +258,51 @@ def NumPyRandomGeneratorType_shuffle(inst, x, axis=0):
     check_types(x, [types.Array], 'x')
     check_types(axis, [int, types.Integer], 'axis')
 
+    if x.ndim == 1:
+        # Elements of a 1-D array are swapped as scalars, this avoids
+        # the buffer and the sub-array views needed for the general case.
+        def impl(inst, x, axis=0):
+            if axis < 0:
+                axis = axis + x.ndim
+            if axis > x.ndim - 1 or axis < 0:
+                raise IndexError("Axis is out of bounds for the given array")
+
+            bitgen = inst.bit_generator
+            for i in range(len(x) - 1, 0, -1):
+                j = types.intp(random_methods.random_interval(bitgen, i))
+                # When i == j the swap is a no-op, doing it anyway is
+                # cheaper than a hard to predict branch.
+                tmp = x[j]
+                x[j] = x[i]
+                x[i] = tmp
+
+        return impl
+
+    if x.ndim == 2:
+        # Rows are swapped element by element. Assigning one strided row
+        # to another would go through a temporary copy whenever the
+        # memory extents of the rows overlap, e.g. for axis=1.
+        def impl(inst, x, axis=0):
+            if axis < 0:
+                axis = axis + x.ndim
+            if axis > x.ndim - 1 or axis < 0:
+                raise IndexError("Axis is out of bounds for the given array")
+
+            z = np.swapaxes(x, 0, axis)
+            bitgen = inst.bit_generator
+            for i in range(len(z) - 1, 0, -1):
+                j = types.intp(random_methods.random_interval(bitgen, i))
+                if i == j:
+                    continue
+                zi = z[i]
+                zj = z[j]
+                for k in range(zi.shape[0]):
+                    tmp = zj[k]
+                    zj[k] = zi[k]
+                    zi[k] = tmp
+
+        return impl
+
     def impl(inst, x, axis=0):
         if axis < 0:
             axis = axis + x.ndim
@@ -183,16 +310,19 @@ def NumPyRandomGeneratorType_shuffle(inst, x, axis=0):
             raise IndexError("Axis is out of bounds for the given array")
 
         z = np.swapaxes(x, 0, axis)
-        buf = np.empty_like(z[0, ...])
+        # The buffer holds a single sub-array along the shuffled axis, it
+        # is shaped from the remaining dimensions so that it can be
+        # allocated even when the shuffled axis is empty.
+        buf = np.empty(z.shape[1:], dtype=x.dtype)
 
+        bitgen = inst.bit_generator
         for i in range(len(z) - 1, 0, -1):
-            j = types.intp(random_methods.random_interval(inst.bit_generator,
-                                                          i))
+            j = types.intp(random_methods.random_interval(bitgen, i))
             if i == j:
                 continue
-            buf[...] = z[j, ...]
-            z[j, ...] = z[i, ...]
-            z[i, ...] = buf
+            buf[:] = z[j]
+            z[j] = z[i]
+            z[i] = buf
 
     return impl
 
@@ -205,16 +335,21 @@ def NumPyRandomGeneratorType_permutation(inst, x, axis=0):
     check_types(x, [types.Array, types.Integer], 'x')
     check_types(axis, [int, types.Integer], 'axis')
 
-    IS_INT = isinstance(x, types.Integer)
-
-    def impl(inst, x, axis=0):
-        if IS_INT:
+    if isinstance(x, types.Integer):
+        # NumPy ignores the axis argument when x is an integer. The
+        # identity is built first and shuffled afterwards (rather than
+        # generated shuffled in a single "inside-out" pass), as that is
+        # the order in which NumPy draws from the BitGenerator.
+        def impl(inst, x, axis=0):
             new_arr = np.arange(x)
-            # NumPy ignores the axis argument when x is an integer
             inst.shuffle(new_arr)
-        else:
-            new_arr = x.copy()
-            inst.shuffle(new_arr, axis=axis)
+            return new_arr
+
+        return impl
+
+    def impl(inst, x, axis=0):
+        new_arr = x.copy()
+        inst.shuffle(new_arr, axis=axis)
         return new_arr
 
     return impl
@@ -237,32 +372,62 @@ def NumPyRandomGeneratorType_random(inst, size=None, dtype=np.float64):
 
         def impl(inst, size=None, dtype=np.float64):
             out = np.empty(size, dtype=dtype)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = dist_func(inst.bit_generator)
+            _fill(out, inst.bit_generator, dist_func)
             return out
         return impl
 
 
 # Overload the Generator().standard_exponential() method
-@overload_method(types.NumPyRandomGeneratorType, 'standard_exponential')
+@overload_method(types.NumPyRandomGeneratorType, 'standard_exponential',
+                 prefer_literal=True)
 def NumPyRandomGeneratorType_standard_exponential(inst, size=None,
                                                   dtype=np.float64,
                                                   method='zig'):
-    check_types(method, [types.UnicodeType, str], 'method')
-    dist_func_inv, nb_dt = _get_proper_func(
-        random_standard_exponential_inv_f,
-        random_standard_exponential_inv,
+    check_types(method, [types.UnicodeType, types.StringLiteral, str],
+                'method')
+    (dist_func, dist_func_inv, fill_func), nb_dt = _get_proper_func(
+        (random_standard_exponential_f, random_standard_exponential_inv_f,
+         random_standard_exponential_fill_f),
+        (random_standard_exponential, random_standard_exponential_inv,
+         random_standard_exponential_fill),
         dtype
     )
 
-    dist_func, nb_dt = _get_proper_func(random_standard_exponential_f,
-                                        random_standard_exponential,
-                                        dtype)
+    @register_jitable
+    def fill_func_inv(bitgen, out):
+        _fill(out, bitgen, dist_func_inv)
 
     if isinstance(size, types.Omitted):
         size = size.value
 
+    # When the method is known at compile time, only the loop for the
+    # selected method is emitted.
+    if isinstance(method, types.Omitted):
+        method = method.value
+    if isinstance(method, types.StringLiteral):
+        method = method.literal_value
+
+    if method in ('zig', 'inv'):
+        if method == 'zig':
+            method_func = dist_func
+            method_fill_func = fill_func
+        else:
+            method_func = dist_func_inv
+            method_fill_func = fill_func_inv
+
+        if is_nonelike(size):
+            def impl(inst, size=None, dtype=np.float64, method='zig'):
+                return nb_dt(method_func(inst.bit_generator))
+            return impl
+        else:
+            check_size(size)
+
+            def impl(inst, size=None, dtype=np.float64, method='zig'):
+                out = np.empty(size, dtype=dtype)
+                method_fill_func(inst.bit_generator, out.ravel())
+                return out
+            return impl
+
     if is_nonelike(size):
         def impl(inst, size=None, dtype=np.float64, method='zig'):
             if method == 'zig':
@@ -276,16 +441,13 @@ def NumPyRandomGeneratorType_standard_exponential(inst, size=None,
         check_size(size)
 
         def impl(inst, size=None, dtype=np.float64, method='zig'):
+            if method != 'zig' and method != 'inv':
+                raise ValueError("Method must be either 'zig' or 'inv'")
             out = np.empty(size, dtype=dtype)
-            out_f = out.flat
             if method == 'zig':
-                for i in range(out.size):
-                    out_f[i] = dist_func(inst.bit_generator)
-            elif method == 'inv':
-                for i in range(out.size):
-                    out_f[i] = dist_func_inv(inst.bit_generator)
+                fill_func(inst.bit_generator, out.ravel())
             else:
-                raise ValueError("Method must be either 'zig' or 'inv'")
+                fill_func_inv(inst.bit_generator, out.ravel())
             return out
         return impl
 
@@ -293,9 +455,11 @@ def NumPyRandomGeneratorType_standard_exponential(inst, size=None,
 # Overload the Generator().standard_normal() method
 @overload_method(types.NumPyRandomGeneratorType, 'standard_normal')
 def NumPyRandomGeneratorType_standard_normal(inst, size=None, dtype=np.float64):
-    dist_func, nb_dt = _get_proper_func(random_standard_normal_f,
-                                        random_standard_normal,
-                                        dtype)
+    (dist_func, fill_func), nb_dt = _get_proper_func(
+        (random_standard_normal_f, random_standard_normal_fill_f),
+        (random_standard_normal, random_standard_normal_fill),
+        dtype
+    )
     if isinstance(size, types.Omitted):
         size = size.value
 
@@ -308,9 +472,7 @@ def NumPyRandomGeneratorType_standard_normal(inst, size=None, dtype=np.float64):
 
         def impl(inst, size=None, dtype=np.float64):
             out = np.empty(size, dtype=dtype)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = dist_func(inst.bit_generator)
+            fill_func(inst.bit_generator, out.ravel())
             return out
         return impl
 
@@ -335,9 +497,7 @@ def NumPyRandomGeneratorType_standard_gamma(inst, shape, size=None,
 
         def impl(inst, shape, size=None, dtype=np.float64):
             out = np.empty(size, dtype=dtype)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = dist_func(inst.bit_generator, shape)
+            _fill(out, inst.bit_generator, dist_func, shape)
             return out
         return impl
 
@@ -345,24 +505,23 @@ def NumPyRandomGeneratorType_standard_gamma(inst, shape, size=None,
 # Overload the Generator().normal() method
 @overload_method(types.NumPyRandomGeneratorType, 'normal')
 def NumPyRandomGeneratorType_normal(inst, loc=0.0, scale=1.0,
-                                    size=None):
+                                    size=None, dtype=np.float64):
     check_types(loc, [types.Float, types.Integer, int, float], 'loc')
     check_types(scale, [types.Float, types.Integer, int, float], 'scale')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, loc=0.0, scale=1.0, size=None):
-            return random_normal(inst.bit_generator, loc, scale)
+        def impl(inst, loc=0.0, scale=1.0, size=None, dtype=np.float64):
+            return nb_dt(random_normal(inst.bit_generator, loc, scale))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, loc=0.0, scale=1.0, size=None):
-            out = np.empty(size, dtype=np.float64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_normal(inst.bit_generator, loc, scale)
+        def impl(inst, loc=0.0, scale=1.0, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_normal, loc, scale)
             return out
         return impl
 
@@ -370,480 +529,484 @@ def NumPyRandomGeneratorType_normal(inst, loc=0.0, scale=1.0,
 # Overload the Generator().uniform() method
 @overload_method(types.NumPyRandomGeneratorType, 'uniform')
 def NumPyRandomGeneratorType_uniform(inst, low=0.0, high=1.0,
-                                     size=None):
+                                     size=None, dtype=np.float64):
     check_types(low, [types.Float, types.Integer, int, float], 'low')
     check_types(high, [types.Float, types.Integer, int, float], 'high')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, low=0.0, high=1.0, size=None):
-            return random_uniform(inst.bit_generator, low, high - low)
+        def impl(inst, low=0.0, high=1.0, size=None, dtype=np.float64):
+            return nb_dt(random_uniform(inst.bit_generator, low, high - low))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, low=0.0, high=1.0, size=None):
-            out = np.empty(size, dtype=np.float64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_uniform(inst.bit_generator, low, high - low)
+        def impl(inst, low=0.0, high=1.0, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_uniform, low, high - low)
             return out
         return impl
 
 
 # Overload the Generator().exponential() method
 @overload_method(types.NumPyRandomGeneratorType, 'exponential')
-def NumPyRandomGeneratorType_exponential(inst, scale=1.0, size=None):
+def NumPyRandomGeneratorType_exponential(inst, scale=1.0,
+                                         size=None, dtype=np.float64):
     check_types(scale, [types.Float, types.Integer, int, float], 'scale')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, scale=1.0, size=None):
-            return random_exponential(inst.bit_generator, scale)
+        def impl(inst, scale=1.0, size=None, dtype=np.float64):
+            return nb_dt(random_exponential(inst.bit_generator, scale))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, scale=1.0, size=None):
-            out = np.empty(size, dtype=np.float64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_exponential(inst.bit_generator, scale)
+        def impl(inst, scale=1.0, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_exponential, scale)
             return out
         return impl
 
 
 # Overload the Generator().gamma() method
 @overload_method(types.NumPyRandomGeneratorType, 'gamma')
-def NumPyRandomGeneratorType_gamma(inst, shape, scale=1.0, size=None):
+def NumPyRandomGeneratorType_gamma(inst, shape, scale=1.0,
+                                   size=None, dtype=np.float64):
     check_types(shape, [types.Float, types.Integer, int, float], 'shape')
     check_types(scale, [types.Float, types.Integer, int, float], 'scale')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, shape, scale=1.0, size=None):
-            return random_gamma(inst.bit_generator, shape, scale)
+        def impl(inst, shape, scale=1.0, size=None, dtype=np.float64):
+            return nb_dt(random_gamma(inst.bit_generator, shape, scale))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, shape, scale=1.0, size=None):
-            out = np.empty(size, dtype=np.float64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_gamma(inst.bit_generator, shape, scale)
+        def impl(inst, shape, scale=1.0, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_gamma, shape, scale)
             return out
         return impl
 
 
 # Overload the Generator().beta() method
 @overload_method(types.NumPyRandomGeneratorType, 'beta')
-def NumPyRandomGeneratorType_beta(inst, a, b, size=None):
+def NumPyRandomGeneratorType_beta(inst, a, b, size=None, dtype=np.float64):
     check_types(a, [types.Float, types.Integer, int, float], 'a')
     check_types(b, [types.Float, types.Integer, int, float], 'b')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, a, b, size=None):
-            return random_beta(inst.bit_generator, a, b)
+        def impl(inst, a, b, size=None, dtype=np.float64):
+            return nb_dt(random_beta(inst.bit_generator, a, b))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, a, b, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_beta(inst.bit_generator, a, b)
+        def impl(inst, a, b, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_beta, a, b)
             return out
         return impl
 
 
 # Overload the Generator().f() method
 @overload_method(types.NumPyRandomGeneratorType, 'f')
-def NumPyRandomGeneratorType_f(inst, dfnum, dfden, size=None):
+def NumPyRandomGeneratorType_f(inst, dfnum, dfden,
+                               size=None, dtype=np.float64):
     check_types(dfnum, [types.Float, types.Integer, int, float], 'dfnum')
     check_types(dfden, [types.Float, types.Integer, int, float], 'dfden')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, dfnum, dfden, size=None):
-            return random_f(inst.bit_generator, dfnum, dfden)
+        def impl(inst, dfnum, dfden, size=None, dtype=np.float64):
+            return nb_dt(random_f(inst.bit_generator, dfnum, dfden))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, dfnum, dfden, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_f(inst.bit_generator, dfnum, dfden)
+        def impl(inst, dfnum, dfden, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_f, dfnum, dfden)
             return out
         return impl
 
 
 # Overload the Generator().chisquare() method
 @overload_method(types.NumPyRandomGeneratorType, 'chisquare')
-def NumPyRandomGeneratorType_chisquare(inst, df, size=None):
+def NumPyRandomGeneratorType_chisquare(inst, df, size=None, dtype=np.float64):
     check_types(df, [types.Float, types.Integer, int, float], 'df')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, df, size=None):
-            return random_chisquare(inst.bit_generator, df)
+        def impl(inst, df, size=None, dtype=np.float64):
+            return nb_dt(random_chisquare(inst.bit_generator, df))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, df, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_chisquare(inst.bit_generator, df)
+        def impl(inst, df, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_chisquare, df)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'standard_cauchy')
-def NumPyRandomGeneratorType_standard_cauchy(inst, size=None):
+def NumPyRandomGeneratorType_standard_cauchy(inst,
+                                             size=None, dtype=np.float64):
 
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, size=None):
-            return random_standard_cauchy(inst.bit_generator)
+        def impl(inst, size=None, dtype=np.float64):
+            return nb_dt(random_standard_cauchy(inst.bit_generator))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_standard_cauchy(inst.bit_generator)
+        def impl(inst, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_standard_cauchy)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'pareto')
-def NumPyRandomGeneratorType_pareto(inst, a, size=None):
+def NumPyRandomGeneratorType_pareto(inst, a, size=None, dtype=np.float64):
     check_types(a, [types.Float, types.Integer, int, float], 'a')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, a, size=None):
-            return random_pareto(inst.bit_generator, a)
+        def impl(inst, a, size=None, dtype=np.float64):
+            return nb_dt(random_pareto(inst.bit_generator, a))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, a, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_pareto(inst.bit_generator, a)
+        def impl(inst, a, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_pareto, a)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'weibull')
-def NumPyRandomGeneratorType_weibull(inst, a, size=None):
+def NumPyRandomGeneratorType_weibull(inst, a, size=None, dtype=np.float64):
     check_types(a, [types.Float, types.Integer, int, float], 'a')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, a, size=None):
-            return random_weibull(inst.bit_generator, a)
+        def impl(inst, a, size=None, dtype=np.float64):
+            return nb_dt(random_weibull(inst.bit_generator, a))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, a, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_weibull(inst.bit_generator, a)
+        def impl(inst, a, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_weibull, a)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'power')
-def NumPyRandomGeneratorType_power(inst, a, size=None):
+def NumPyRandomGeneratorType_power(inst, a, size=None, dtype=np.float64):
     check_types(a, [types.Float, types.Integer, int, float], 'a')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, a, size=None):
-            return random_power(inst.bit_generator, a)
+        def impl(inst, a, size=None, dtype=np.float64):
+            return nb_dt(random_power(inst.bit_generator, a))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, a, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_power(inst.bit_generator, a)
+        def impl(inst, a, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_power, a)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'laplace')
-def NumPyRandomGeneratorType_laplace(inst, loc=0.0, scale=1.0, size=None):
+def NumPyRandomGeneratorType_laplace(inst, loc=0.0, scale=1.0,
+                                     size=None, dtype=np.float64):
     check_types(loc, [types.Float, types.Integer, int, float], 'loc')
     check_types(scale, [types.Float, types.Integer, int, float], 'scale')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, loc=0.0, scale=1.0, size=None):
-            return random_laplace(inst.bit_generator, loc, scale)
+        def impl(inst, loc=0.0, scale=1.0, size=None, dtype=np.float64):
+            return nb_dt(random_laplace(inst.bit_generator, loc, scale))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, loc=0.0, scale=1.0, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_laplace(inst.bit_generator, loc, scale)
+        def impl(inst, loc=0.0, scale=1.0, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_laplace, loc, scale)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'logistic')
-def NumPyRandomGeneratorType_logistic(inst, loc=0.0, scale=1.0, size=None):
+def NumPyRandomGeneratorType_logistic(inst, loc=0.0, scale=1.0,
+                                      size=None, dtype=np.float64):
     check_types(loc, [types.Float, types.Integer, int, float], 'loc')
     check_types(scale, [types.Float, types.Integer, int, float], 'scale')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, loc=0.0, scale=1.0, size=None):
-            return random_logistic(inst.bit_generator, loc, scale)
+        def impl(inst, loc=0.0, scale=1.0, size=None, dtype=np.float64):
+            return nb_dt(random_logistic(inst.bit_generator, loc, scale))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, loc=0.0, scale=1.0, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_logistic(inst.bit_generator, loc, scale)
+        def impl(inst, loc=0.0, scale=1.0, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_logistic, loc, scale)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'lognormal')
-def NumPyRandomGeneratorType_lognormal(inst, mean=0.0, sigma=1.0, size=None):
+def NumPyRandomGeneratorType_lognormal(inst, mean=0.0, sigma=1.0,
+                                       size=None, dtype=np.float64):
     check_types(mean, [types.Float, types.Integer, int, float], 'mean')
     check_types(sigma, [types.Float, types.Integer, int, float], 'sigma')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, mean=0.0, sigma=1.0, size=None):
-            return random_lognormal(inst.bit_generator, mean, sigma)
+        def impl(inst, mean=0.0, sigma=1.0, size=None, dtype=np.float64):
+            return nb_dt(random_lognormal(inst.bit_generator, mean, sigma))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, mean=0.0, sigma=1.0, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_lognormal(inst.bit_generator, mean, sigma)
+        def impl(inst, mean=0.0, sigma=1.0, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_lognormal, mean, sigma)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'rayleigh')
-def NumPyRandomGeneratorType_rayleigh(inst, scale=1.0, size=None):
+def NumPyRandomGeneratorType_rayleigh(inst, scale=1.0,
+                                      size=None, dtype=np.float64):
     check_types(scale, [types.Float, types.Integer, int, float], 'scale')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, scale=1.0, size=None):
-            return random_rayleigh(inst.bit_generator, scale)
+        def impl(inst, scale=1.0, size=None, dtype=np.float64):
+            return nb_dt(random_rayleigh(inst.bit_generator, scale))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, scale=1.0, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_rayleigh(inst.bit_generator, scale)
+        def impl(inst, scale=1.0, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_rayleigh, scale)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'standard_t')
-def NumPyRandomGeneratorType_standard_t(inst, df, size=None):
+def NumPyRandomGeneratorType_standard_t(inst, df, size=None, dtype=np.float64):
     check_types(df, [types.Float, types.Integer, int, float], 'df')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, df, size=None):
-            return random_standard_t(inst.bit_generator, df)
+        def impl(inst, df, size=None, dtype=np.float64):
+            return nb_dt(random_standard_t(inst.bit_generator, df))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, df, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_standard_t(inst.bit_generator, df)
+        def impl(inst, df, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_standard_t, df)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'wald')
-def NumPyRandomGeneratorType_wald(inst, mean, scale, size=None):
+def NumPyRandomGeneratorType_wald(inst, mean, scale,
+                                  size=None, dtype=np.float64):
     check_types(mean, [types.Float, types.Integer, int, float], 'mean')
     check_types(scale, [types.Float, types.Integer, int, float], 'scale')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, mean, scale, size=None):
-            return random_wald(inst.bit_generator, mean, scale)
+        def impl(inst, mean, scale, size=None, dtype=np.float64):
+            return nb_dt(random_wald(inst.bit_generator, mean, scale))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, mean, scale, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_wald(inst.bit_generator, mean, scale)
+        def impl(inst, mean, scale, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_wald, mean, scale)
             return out
         return impl
 
 
+# random_geometric and random_zipf return float64 values, these go through
+# np.int64 first so that casting them to np.int32 wraps as in NumPy instead
+# of being undefined for values that do not fit.
+@register_jitable
+def _random_geometric_int(bitgen, p):
+    return np.int64(random_geometric(bitgen, p))
+
+
+@register_jitable
+def _random_zipf_int(bitgen, a):
+    return np.int64(random_zipf(bitgen, a))
+
+
 @overload_method(types.NumPyRandomGeneratorType, 'geometric')
-def NumPyRandomGeneratorType_geometric(inst, p, size=None):
+def NumPyRandomGeneratorType_geometric(inst, p, size=None, dtype=np.int64):
     check_types(p, [types.Float, types.Integer, int, float], 'p')
+    nb_dt, _ = _get_dtype(dtype, _int_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, p, size=None):
-            return np.int64(random_geometric(inst.bit_generator, p))
+        def impl(inst, p, size=None, dtype=np.int64):
+            return nb_dt(_random_geometric_int(inst.bit_generator, p))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, p, size=None):
-            out = np.empty(size, dtype=np.int64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_geometric(inst.bit_generator, p)
+        def impl(inst, p, size=None, dtype=np.int64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, _random_geometric_int, p)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'zipf')
-def NumPyRandomGeneratorType_zipf(inst, a, size=None):
+def NumPyRandomGeneratorType_zipf(inst, a, size=None, dtype=np.int64):
     check_types(a, [types.Float, types.Integer, int, float], 'a')
+    nb_dt, _ = _get_dtype(dtype, _int_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, a, size=None):
-            return np.int64(random_zipf(inst.bit_generator, a))
+        def impl(inst, a, size=None, dtype=np.int64):
+            return nb_dt(_random_zipf_int(inst.bit_generator, a))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, a, size=None):
-            out = np.empty(size, dtype=np.int64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_zipf(inst.bit_generator, a)
+        def impl(inst, a, size=None, dtype=np.int64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, _random_zipf_int, a)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'triangular')
-def NumPyRandomGeneratorType_triangular(inst, left, mode, right, size=None):
+def NumPyRandomGeneratorType_triangular(inst, left, mode, right,
+                                        size=None, dtype=np.float64):
     check_types(left, [types.Float, types.Integer, int, float], 'left')
     check_types(mode, [types.Float, types.Integer, int, float], 'mode')
     check_types(right, [types.Float, types.Integer, int, float], 'right')
+    nb_dt, _ = _get_dtype(dtype, _float_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, left, mode, right, size=None):
-            return random_triangular(inst.bit_generator, left, mode, right)
+        def impl(inst, left, mode, right, size=None, dtype=np.float64):
+            return nb_dt(random_triangular(inst.bit_generator,
+                                           left, mode, right))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, left, mode, right, size=None):
-            out = np.empty(size)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_triangular(inst.bit_generator,
-                                             left, mode, right)
+        def impl(inst, left, mode, right, size=None, dtype=np.float64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_triangular,
+                  left, mode, right)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'poisson')
-def NumPyRandomGeneratorType_poisson(inst, lam , size=None):
+def NumPyRandomGeneratorType_poisson(inst, lam , size=None, dtype=np.int64):
     check_types(lam, [types.Float, types.Integer, int, float], 'lam')
+    nb_dt, _ = _get_dtype(dtype, _int_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst, lam , size=None):
-            return np.int64(random_poisson(inst.bit_generator, lam))
+        def impl(inst, lam , size=None, dtype=np.int64):
+            return nb_dt(random_poisson(inst.bit_generator, lam))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, lam , size=None):
-            out = np.empty(size, dtype=np.int64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_poisson(inst.bit_generator, lam)
+        def impl(inst, lam , size=None, dtype=np.int64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_poisson, lam)
             return out
         return impl
 
 
 @overload_method(types.NumPyRandomGeneratorType, 'negative_binomial')
-def NumPyRandomGeneratorType_negative_binomial(inst, n, p, size=None):
+def NumPyRandomGeneratorType_negative_binomial(inst, n, p, size=None,
+                                               dtype=np.int64):
     check_types(n, [types.Float, types.Integer, int, float], 'n')
     check_types(p, [types.Float, types.Integer, int, float], 'p')
+    nb_dt, _ = _get_dtype(dtype, _int_dtypes)
     if isinstance(size, types.Omitted):
         size = size.value
 
     if is_nonelike(size):
-        def impl(inst,  n, p , size=None):
-            return np.int64(random_negative_binomial(inst.bit_generator, n, p))
+        def impl(inst,  n, p , size=None, dtype=np.int64):
+            return nb_dt(random_negative_binomial(inst.bit_generator, n, p))
         return impl
     else:
         check_size(size)
 
-        def impl(inst, n, p , size=None):
-            out = np.empty(size, dtype=np.int64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_negative_binomial(inst.bit_generator, n, p)
+        def impl(inst, n, p , size=None, dtype=np.int64):
+            out = np.empty(size, dtype=dtype)
+            _fill(out, inst.bit_generator, random_negative_binomial, n, p)
             return out
         return impl
 
@@ -874,10 +1037,8 @@ def NumPyRandomGeneratorType_noncentral_chisquare(inst, df, nonc, size=None):
         def impl(inst, df, nonc, size=None):
             check_arg_bounds(df, nonc)
             out = np.empty(size, dtype=np.float64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_noncentral_chisquare(inst.bit_generator,
-                                                       df, nonc)
+            _fill(out, inst.bit_generator, random_noncentral_chisquare,
+                  df, nonc)
             return out
         return impl
 
@@ -911,10 +1072,8 @@ def NumPyRandomGeneratorType_noncentral_f(inst, dfnum, dfden, nonc, size=None):
         def impl(inst, dfnum, dfden, nonc, size=None):
             check_arg_bounds(dfnum, dfden, nonc)
             out = np.empty(size, dtype=np.float64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_noncentral_f(inst.bit_generator,
-                                               dfnum, dfden, nonc)
+            _fill(out, inst.bit_generator, random_noncentral_f,
+                  dfnum, dfden, nonc)
             return out
         return impl
 
@@ -941,8 +1100,6 @@ def NumPyRandomGeneratorType_logseries(inst, p, size=None):
         def impl(inst, p, size=None):
             check_arg_bounds(p)
             out = np.empty(size, dtype=np.int64)
-            out_f = out.flat
-            for i in range(out.size):
-                out_f[i] = random_logseries(inst.bit_generator, p)
+            _fill(out, inst.bit_generator, random_logseries, p)
             return out
         return impl
@@ -1,7 +1,11 @@
 import numpy as np
+from llvmlite import ir
 
 from numba import uint64, uint32, uint16, uint8
-from numba.core.extending import register_jitable
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.core.extending import intrinsic, overload, register_jitable
+from numba.np.numpy_support import from_dtype
 
 from numba.np.random._constants import (UINT32_MAX, UINT64_MAX,
                                         UINT16_MAX, UINT8_MAX)
@@ -23,6 +27,20 @@ def gen_mask(max):
     return mask
 
 
+@register_jitable
+def is_pow2_range(rng):
+    """
+    Checks whether the number of values in the closed interval
+    [0, rng] is a power of two.
+
+    For such ranges Lemire's rejection threshold is always zero, so
+    the scaled draw never needs to be rejected and the rejection loop
+    can be skipped altogether.
+    """
+    rng = uint64(rng)
+    return (rng & (rng + uint64(1))) == 0
+
+
 @register_jitable
 def buffered_bounded_bool(bitgen, off, rng, bcnt, buf):
     if (rng == 0):
@@ -64,7 +82,17 @@ def buffered_uint16(bitgen, bcnt, buf):
 # The following implementations use Lemire's algorithm:
 # https://arxiv.org/abs/1805.10941
 @register_jitable
-def buffered_bounded_lemire_uint8(bitgen, rng, bcnt, buf):
+def lemire_threshold_uint8(rng):
+    """
+    Returns the rejection threshold of Lemire's algorithm for
+    unsigned 8 bit integers bounded by `rng`.
+    """
+    rng_excl = uint8(rng) + uint8(1)
+    return (uint8(UINT8_MAX) - rng) % rng_excl
+
+
+@register_jitable
+def buffered_bounded_lemire_uint8(bitgen, rng, threshold, bcnt, buf):
     """
     Generates a random unsigned 8 bit integer bounded
     within a given interval using Lemire's rejection.
@@ -73,6 +101,10 @@ def buffered_bounded_lemire_uint8(bitgen, rng, bcnt, buf):
     drawn from the associated BitGenerator so that
     multiple integers of smaller bitsize can be generated
     from a single draw of the BitGenerator.
+
+    The rejection `threshold` only depends on `rng`, see
+    `lemire_threshold_uint8`. Small ranges reach the rejection
+    test often, so callers compute it once instead of once per draw.
     """
     # Note: `rng` should not be 0xFF. When this happens `rng_excl` becomes
     # zero.
@@ -87,20 +119,26 @@ def buffered_bounded_lemire_uint8(bitgen, rng, bcnt, buf):
     # Rejection sampling to remove any bias
     leftover = m & 0xFF
 
-    if (leftover < rng_excl):
-        # `rng_excl` is a simple upper bound for `threshold`.
-        threshold = ((uint8(UINT8_MAX) - rng) % rng_excl)
-
-        while (leftover < threshold):
-            n, bcnt, buf = buffered_uint8(bitgen, bcnt, buf)
-            m = uint16(n * rng_excl)
-            leftover = m & 0xFF
+    while (leftover < threshold):
+        n, bcnt, buf = buffered_uint8(bitgen, bcnt, buf)
+        m = uint16(n * rng_excl)
+        leftover = m & 0xFF
 
     return m >> 8, bcnt, buf
 
 
 @register_jitable
-def buffered_bounded_lemire_uint16(bitgen, rng, bcnt, buf):
+def lemire_threshold_uint16(rng):
+    """
+    Returns the rejection threshold of Lemire's algorithm for
+    unsigned 16 bit integers bounded by `rng`.
+    """
+    rng_excl = uint16(rng) + uint16(1)
+    return (uint16(UINT16_MAX) - rng) % rng_excl
+
+
+@register_jitable
+def buffered_bounded_lemire_uint16(bitgen, rng, threshold, bcnt, buf):
     """
     Generates a random unsigned 16 bit integer bounded
     within a given interval using Lemire's rejection.
@@ -109,6 +147,10 @@ def buffered_bounded_lemire_uint16(bitgen, rng, bcnt, buf):
     drawn from the associated BitGenerator so that
     multiple integers of smaller bitsize can be generated
     from a single draw of the BitGenerator.
+
+    The rejection `threshold` only depends on `rng`, see
+    `lemire_threshold_uint16`. Small ranges reach the rejection
+    test often, so callers compute it once instead of once per draw.
     """
     # Note: `rng` should not be 0xFFFF. When this happens `rng_excl` becomes
     # zero.
@@ -123,14 +165,10 @@ def buffered_bounded_lemire_uint16(bitgen, rng, bcnt, buf):
     # Rejection sampling to remove any bias
     leftover = m & 0xFFFF
 
-    if (leftover < rng_excl):
-        # `rng_excl` is a simple upper bound for `threshold`.
-        threshold = ((uint16(UINT16_MAX) - rng) % rng_excl)
-
-        while (leftover < threshold):
-            n, bcnt, buf = buffered_uint16(bitgen, bcnt, buf)
-            m = uint32(n * rng_excl)
-            leftover = m & 0xFFFF
+    while (leftover < threshold):
+        n, bcnt, buf = buffered_uint16(bitgen, bcnt, buf)
+        m = uint32(n * rng_excl)
+        leftover = m & 0xFFFF
 
     return m >> 16, bcnt, buf
 
@@ -162,6 +200,28 @@ def buffered_bounded_lemire_uint32(bitgen, rng):
     return (m >> 32)
 
 
+@intrinsic
+def umul_hi64(typingctx, a, b):
+    """
+    Returns the upper 64 bits of the 128 bit product of two
+    unsigned 64 bit integers.
+
+    This is the equivalent of NumPy's `__uint128_t` based `_umul128`,
+    LLVM lowers it to a single widening multiplication where the target
+    supports one (and to `multi3` elsewhere).
+    """
+    sig = types.uint64(types.uint64, types.uint64)
+
+    def codegen(context, builder, sig, args):
+        i128 = ir.IntType(128)
+        x = builder.zext(args[0], i128)
+        y = builder.zext(args[1], i128)
+        m = builder.lshr(builder.mul(x, y), ir.Constant(i128, 64))
+        return builder.trunc(m, ir.IntType(64))
+
+    return sig, codegen
+
+
 @register_jitable
 def bounded_lemire_uint64(bitgen, rng):
     """
@@ -183,18 +243,35 @@ def bounded_lemire_uint64(bitgen, rng):
             x = next_uint64(bitgen)
             leftover = uint64(x) * uint64(rng_excl)
 
-    x0 = x & uint64(0xFFFFFFFF)
-    x1 = x >> 32
-    rng_excl0 = rng_excl & uint64(0xFFFFFFFF)
-    rng_excl1 = rng_excl >> 32
-    w0 = x0 * rng_excl0
-    t = x1 * rng_excl0 + (w0 >> 32)
-    w1 = t & uint64(0xFFFFFFFF)
-    w2 = t >> 32
-    w1 += x0 * rng_excl1
-    m1 = x1 * rng_excl1 + w2 + (w1 >> 32)
+    return umul_hi64(uint64(x), rng_excl)
 
-    return m1
+
+@register_jitable
+def random_bounded_uint64(bitgen, low, rng, dtype):
+    """
+    Returns a single 64 bit integer bounded by given interval.
+
+    Consumes the bit generator exactly like a fill of size one,
+    without allocating the intermediate array.
+    """
+    if rng == 0:
+        return dtype(low)
+    elif rng <= 0xFFFFFFFF:
+        if (rng == 0xFFFFFFFF):
+            return dtype(low + next_uint32(bitgen))
+        elif is_pow2_range(rng):
+            rng_excl = uint64(uint32(rng) + uint32(1))
+            return dtype(low + ((uint64(next_uint32(bitgen)) * rng_excl)
+                                >> 32))
+        else:
+            return dtype(low + buffered_bounded_lemire_uint32(bitgen, rng))
+    elif (rng == 0xFFFFFFFFFFFFFFFF):
+        return dtype(low + next_uint64(bitgen))
+    elif is_pow2_range(rng):
+        rng_excl = uint64(rng) + uint64(1)
+        return dtype(low + umul_hi64(next_uint64(bitgen), rng_excl))
+    else:
+        return dtype(low + bounded_lemire_uint64(bitgen, rng))
 
 
 @register_jitable
@@ -204,27 +281,54 @@ def random_bounded_uint64_fill(bitgen, low, rng, size, dtype):
     bounded by given interval.
     """
     out = np.empty(size, dtype=dtype)
+    out_f = out.ravel()
     if rng == 0:
-        for i in np.ndindex(size):
-            out[i] = low
+        for i in range(out_f.size):
+            out_f[i] = low
     elif rng <= 0xFFFFFFFF:
         if (rng == 0xFFFFFFFF):
-            for i in np.ndindex(size):
-                out[i] = low + next_uint32(bitgen)
+            for i in range(out_f.size):
+                out_f[i] = low + next_uint32(bitgen)
+        elif is_pow2_range(rng):
+            rng_excl = uint64(uint32(rng) + uint32(1))
+            for i in range(out_f.size):
+                out_f[i] = low + ((uint64(next_uint32(bitgen)) * rng_excl)
+                                  >> 32)
         else:
-            for i in np.ndindex(size):
-                out[i] = low + buffered_bounded_lemire_uint32(bitgen, rng)
+            for i in range(out_f.size):
+                out_f[i] = low + buffered_bounded_lemire_uint32(bitgen, rng)
 
     elif (rng == 0xFFFFFFFFFFFFFFFF):
-        for i in np.ndindex(size):
-            out[i] = low + next_uint64(bitgen)
+        for i in range(out_f.size):
+            out_f[i] = low + next_uint64(bitgen)
+    elif is_pow2_range(rng):
+        rng_excl = uint64(rng) + uint64(1)
+        for i in range(out_f.size):
+            out_f[i] = low + umul_hi64(next_uint64(bitgen), rng_excl)
     else:
-        for i in np.ndindex(size):
-            out[i] = low + bounded_lemire_uint64(bitgen, rng)
+        for i in range(out_f.size):
+            out_f[i] = low + bounded_lemire_uint64(bitgen, rng)
 
     return out
 
 
+@register_jitable
+def random_bounded_uint32(bitgen, low, rng, dtype):
+    """
+    Returns a single 32 bit integer bounded by given interval.
+    """
+    if rng == 0:
+        return dtype(low)
+    elif rng == 0xFFFFFFFF:
+        # Lemire32 doesn't support rng = 0xFFFFFFFF.
+        return dtype(low + next_uint32(bitgen))
+    elif is_pow2_range(uint32(rng)):
+        rng_excl = uint64(uint32(rng) + uint32(1))
+        return dtype(low + ((uint64(next_uint32(bitgen)) * rng_excl) >> 32))
+    else:
+        return dtype(low + buffered_bounded_lemire_uint32(bitgen, rng))
+
+
 @register_jitable
 def random_bounded_uint32_fill(bitgen, low, rng, size, dtype):
     """
@@ -232,19 +336,50 @@ def random_bounded_uint32_fill(bitgen, low, rng, size, dtype):
     bounded by given interval.
     """
     out = np.empty(size, dtype=dtype)
+    out_f = out.ravel()
     if rng == 0:
-        for i in np.ndindex(size):
-            out[i] = low
+        for i in range(out_f.size):
+            out_f[i] = low
     elif rng == 0xFFFFFFFF:
         # Lemire32 doesn't support rng = 0xFFFFFFFF.
-        for i in np.ndindex(size):
-            out[i] = low + next_uint32(bitgen)
+        for i in range(out_f.size):
+            out_f[i] = low + next_uint32(bitgen)
+    elif is_pow2_range(uint32(rng)):
+        rng_excl = uint64(uint32(rng) + uint32(1))
+        for i in range(out_f.size):
+            out_f[i] = low + ((uint64(next_uint32(bitgen)) * rng_excl) >> 32)
     else:
-        for i in np.ndindex(size):
-            out[i] = low + buffered_bounded_lemire_uint32(bitgen, rng)
+        for i in range(out_f.size):
+            out_f[i] = low + buffered_bounded_lemire_uint32(bitgen, rng)
     return out
 
 
+@register_jitable
+def random_bounded_uint16(bitgen, low, rng, dtype):
+    """
+    Returns a single 16 bit integer bounded by given interval.
+    """
+    buf = 0
+    bcnt = 0
+
+    if rng == 0:
+        return dtype(low)
+    elif rng == 0xFFFF:
+        # Lemire16 doesn't support rng = 0xFFFF.
+        val, bcnt, buf = buffered_uint16(bitgen, bcnt, buf)
+        return dtype(low + val)
+    elif is_pow2_range(uint16(rng)):
+        rng_excl = uint16(rng) + uint16(1)
+        n, bcnt, buf = buffered_uint16(bitgen, bcnt, buf)
+        return dtype(low + (uint32(n * rng_excl) >> 16))
+    else:
+        threshold = lemire_threshold_uint16(rng)
+        val, bcnt, buf = \
+            buffered_bounded_lemire_uint16(bitgen, rng, threshold,
+                                           bcnt, buf)
+        return dtype(low + val)
+
+
 @register_jitable
 def random_bounded_uint16_fill(bitgen, low, rng, size, dtype):
     """
@@ -255,24 +390,56 @@ def random_bounded_uint16_fill(bitgen, low, rng, size, dtype):
     bcnt = 0
 
     out = np.empty(size, dtype=dtype)
+    out_f = out.ravel()
     if rng == 0:
-        for i in np.ndindex(size):
-            out[i] = low
+        for i in range(out_f.size):
+            out_f[i] = low
     elif rng == 0xFFFF:
         # Lemire16 doesn't support rng = 0xFFFF.
-        for i in np.ndindex(size):
+        for i in range(out_f.size):
             val, bcnt, buf = buffered_uint16(bitgen, bcnt, buf)
-            out[i] = low + val
-
+            out_f[i] = low + val
+    elif is_pow2_range(uint16(rng)):
+        rng_excl = uint16(rng) + uint16(1)
+        for i in range(out_f.size):
+            n, bcnt, buf = buffered_uint16(bitgen, bcnt, buf)
+            out_f[i] = low + (uint32(n * rng_excl) >> 16)
     else:
-        for i in np.ndindex(size):
+        threshold = lemire_threshold_uint16(rng)
+        for i in range(out_f.size):
             val, bcnt, buf = \
-                buffered_bounded_lemire_uint16(bitgen, rng,
+                buffered_bounded_lemire_uint16(bitgen, rng, threshold,
                                                bcnt, buf)
-            out[i] = low + val
+            out_f[i] = low + val
     return out
 
 
+@register_jitable
+def random_bounded_uint8(bitgen, low, rng, dtype):
+    """
+    Returns a single 8 bit integer bounded by given interval.
+    """
+    buf = 0
+    bcnt = 0
+
+    if rng == 0:
+        return dtype(low)
+    elif rng == 0xFF:
+        # Lemire8 doesn't support rng = 0xFF.
+        val, bcnt, buf = buffered_uint8(bitgen, bcnt, buf)
+        return dtype(low + val)
+    elif is_pow2_range(uint8(rng)):
+        rng_excl = uint8(rng) + uint8(1)
+        n, bcnt, buf = buffered_uint8(bitgen, bcnt, buf)
+        return dtype(low + (uint16(n * rng_excl) >> 8))
+    else:
+        threshold = lemire_threshold_uint8(rng)
+        val, bcnt, buf = \
+            buffered_bounded_lemire_uint8(bitgen, rng, threshold,
+                                          bcnt, buf)
+        return dtype(low + val)
+
+
 @register_jitable
 def random_bounded_uint8_fill(bitgen, low, rng, size, dtype):
     """
@@ -283,23 +450,41 @@ def random_bounded_uint8_fill(bitgen, low, rng, size, dtype):
     bcnt = 0
 
     out = np.empty(size, dtype=dtype)
+    out_f = out.ravel()
     if rng == 0:
-        for i in np.ndindex(size):
-            out[i] = low
+        for i in range(out_f.size):
+            out_f[i] = low
     elif rng == 0xFF:
         # Lemire8 doesn't support rng = 0xFF.
-        for i in np.ndindex(size):
+        for i in range(out_f.size):
             val, bcnt, buf = buffered_uint8(bitgen, bcnt, buf)
-            out[i] = low + val
+            out_f[i] = low + val
+    elif is_pow2_range(uint8(rng)):
+        rng_excl = uint8(rng) + uint8(1)
+        for i in range(out_f.size):
+            n, bcnt, buf = buffered_uint8(bitgen, bcnt, buf)
+            out_f[i] = low + (uint16(n * rng_excl) >> 8)
     else:
-        for i in np.ndindex(size):
+        threshold = lemire_threshold_uint8(rng)
+        for i in range(out_f.size):
             val, bcnt, buf = \
-                buffered_bounded_lemire_uint8(bitgen, rng,
+                buffered_bounded_lemire_uint8(bitgen, rng, threshold,
                                               bcnt, buf)
-            out[i] = low + val
+            out_f[i] = low + val
     return out
 
 
+@register_jitable
+def random_bounded_bool(bitgen, low, rng, dtype):
+    """
+    Returns a single boolean value.
+    """
+    buf = 0
+    bcnt = 0
+    val, bcnt, buf = buffered_bounded_bool(bitgen, low, rng, bcnt, buf)
+    return dtype(low + val)
+
+
 @register_jitable
 def random_bounded_bool_fill(bitgen, low, rng, size, dtype):
     """
@@ -308,12 +493,73 @@ def random_bounded_bool_fill(bitgen, low, rng, size, dtype):
     buf = 0
     bcnt = 0
     out = np.empty(size, dtype=dtype)
-    for i in np.ndindex(size):
+    out_f = out.ravel()
+    for i in range(out_f.size):
         val, bcnt, buf = buffered_bounded_bool(bitgen, low, rng, bcnt, buf)
-        out[i] = low + val
+        out_f[i] = low + val
     return out
 
 
+_bounded_funcs = {
+    8: (random_bounded_uint8, random_bounded_uint8_fill),
+    16: (random_bounded_uint16, random_bounded_uint16_fill),
+    32: (random_bounded_uint32, random_bounded_uint32_fill),
+    64: (random_bounded_uint64, random_bounded_uint64_fill),
+}
+
+
+def _get_bounded_funcs(dtype):
+    """
+    Returns the scalar and the fill implementations of bounded integer
+    generation matching a dtype argument, given either as a NumPy type
+    or as its Numba type. Raises a TypingError for unsupported dtypes.
+    """
+    if isinstance(dtype, type):
+        dtype = from_dtype(np.dtype(dtype))
+    elif isinstance(dtype, types.NumberClass):
+        dtype = dtype.instance_type
+    if isinstance(dtype, types.Boolean):
+        return random_bounded_bool, random_bounded_bool_fill
+    if isinstance(dtype, types.Integer) and dtype.bitwidth in _bounded_funcs:
+        return _bounded_funcs[dtype.bitwidth]
+    raise TypingError("Argument dtype is not one of the" +
+                      " expected type(s): " +
+                      "np.int32, np.int64, np.int16, np.int8, "
+                      "np.uint32, np.uint64, np.uint16, np.uint8, "
+                      "np.bool_")
+
+
+def random_bounded(bitgen, low, rng, dtype):
+    """
+    Returns a single integer of type `dtype` bounded by given interval.
+
+    Only usable from jitted code, the implementation for the width of
+    `dtype` is selected at compile time.
+    """
+    pass
+
+
+def random_bounded_fill(bitgen, low, rng, size, dtype):
+    """
+    Returns a new array of given size with integers of type `dtype`
+    bounded by given interval.
+
+    Only usable from jitted code, the implementation for the width of
+    `dtype` is selected at compile time.
+    """
+    pass
+
+
+@overload(random_bounded)
+def ol_random_bounded(bitgen, low, rng, dtype):
+    return _get_bounded_funcs(dtype)[0]
+
+
+@overload(random_bounded_fill)
+def ol_random_bounded_fill(bitgen, low, rng, size, dtype):
+    return _get_bounded_funcs(dtype)[1]
+
+
 @register_jitable
 def _randint_arg_check(low, high, endpoint, lower_bound, upper_bound):
     """
@@ -341,7 +587,10 @@ def _randint_arg_check(low, high, endpoint, lower_bound, upper_bound):
     else:
         if high > upper_bound:
             raise ValueError("high is out of bounds")
-        if low > high:  # -1 already subtracted, closed interval
+        # -1 is not subtracted here to avoid an overflow at the lower
+        # bound of the datatype, an empty half-open interval is checked
+        # for explicitly instead.
+        if low > high or (low == high and not endpoint):
             raise ValueError("low is greater than high in given interval")
 
 
@@ -3,6 +3,7 @@
 import unittest
 import numpy as np
 import numba
+from numba.tests.support import skip_parfors_unsupported
 
 
 class NumpyGeneratorUsageTest(unittest.TestCase):
@@ -33,6 +34,35 @@ class NumpyGeneratorUsageTest(unittest.TestCase):
         for _np_res, _nb_res in zip(original, numba_res):
             self.assertEqual(_np_res, _nb_res)
 
+    @skip_parfors_unsupported
+    def test_numpy_gen_parallel_usage(self):
+        # magictoken.npgen_parallel_usage.begin
+        from numba import prange
+
+        n_streams = 4
+        size = 1000
+
+        # Each child SeedSequence gives an independent stream of random
+        # numbers, one Generator per parallel iteration.
+        seeds = np.random.SeedSequence(1).spawn(n_streams)
+        generators = tuple(np.random.default_rng(s) for s in seeds)
+
+        @numba.njit(parallel=True)
+        def parallel_fill(gens, size):
+            n = len(gens)
+            out = np.empty((n, size))
+            for i in prange(n):
+                # Only the i-th iteration ever draws from gens[i]
+                out[i] = gens[i].standard_normal(size)
+            return out
+
+        res = parallel_fill(generators, size)
+        # magictoken.npgen_parallel_usage.end
+        seeds = np.random.SeedSequence(1).spawn(n_streams)
+        expected = np.array([np.random.default_rng(s).standard_normal(size)
+                             for s in seeds])
+        np.testing.assert_allclose(res, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
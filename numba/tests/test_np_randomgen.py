@@ -3,14 +3,18 @@ import numpy as np
 import sys
 import itertools
 import gc
+import warnings
 
 from numba import types
 from numba.tests.support import TestCase, MemoryLeakMixin
 from numba.np.random.generator_methods import _get_proper_func
+from numba.np.random import random_methods
 from numba.np.random.generator_core import next_uint32, next_uint64, next_double
 from numpy.random import MT19937, Generator
 from numba.core.errors import TypingError
-from numba.tests.support import run_in_new_process_caching, SerialMixin
+from numba.tests.support import (run_in_new_process_caching, SerialMixin,
+                                 skip_parfors_unsupported)
+from numba.typed import List
 
 
 # TODO: Following testing tolerance adjustments should be reduced
@@ -34,6 +38,13 @@ class TestHelperFuncs(TestCase):
         self.assertEqual(_get_proper_func(test_32bit_func, test_64bit_func,
                          np.float32)[0](), 32)
 
+        # Several implementations can be selected at once
+        funcs, nb_dt = _get_proper_func((test_32bit_func, test_32bit_func),
+                                        (test_64bit_func, test_64bit_func),
+                                        np.float32)
+        self.assertEqual([f() for f in funcs], [32, 32])
+        self.assertEqual(nb_dt, types.float32)
+
         # With any other datatype it should return a TypingError
         with self.assertRaises(TypingError) as raises:
             _get_proper_func(test_32bit_func, test_64bit_func, np.int32)
@@ -143,6 +154,54 @@ class TestHelperFuncs(TestCase):
             str(raises.exception)
         )
 
+        # Empty half-open intervals, including non-positive bounds
+        for low, high in [(0, 0), (-5, -5), (5, 5)]:
+            with self.subTest(low=low, high=high):
+                with self.assertRaises(ValueError) as raises:
+                    numba_func_endpoint_false(rng, low, high, np.int64)
+                self.assertIn(
+                    'low is greater than high in given interval',
+                    str(raises.exception)
+                )
+
+        # Compile time constant bounds are checked at runtime too
+        literal_cases = [
+            (lambda x: x.integers(-1, 10, dtype=np.uint8),
+             'low is out of bounds'),
+            (lambda x: x.integers(0, 257, dtype=np.uint8),
+             'high is out of bounds'),
+            (lambda x: x.integers(0, 128, dtype=np.int8, endpoint=True),
+             'high is out of bounds'),
+            (lambda x: x.integers(105, 100, size=3, dtype=np.uint32),
+             'low is greater than high in given interval'),
+            (lambda x: x.integers(0, 0),
+             'low is greater than high in given interval'),
+            (lambda x: x.integers(-5, -5, size=3),
+             'low is greater than high in given interval'),
+        ]
+        for py_func, msg in literal_cases:
+            with self.subTest(msg=msg):
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter('always')
+                    with self.assertRaises(ValueError) as raises:
+                        numba.njit()(py_func)(rng)
+                self.assertIn(msg, str(raises.exception))
+                self.assertEqual(w, [])
+
+    def test_umul_hi64(self):
+        umul_hi64 = numba.njit(lambda a, b: random_methods.umul_hi64(a, b))
+        cases = [
+            (0, 0),
+            (1, 0xFFFFFFFFFFFFFFFF),
+            (0xFFFFFFFFFFFFFFFF, 0xFFFFFFFFFFFFFFFF),
+            (0x123456789ABCDEF0, 0x0FEDCBA987654321),
+            (0xFFFFFFFF, 0x100000001),
+        ]
+        for a, b in cases:
+            with self.subTest(a=a, b=b):
+                self.assertPreciseEqual(umul_hi64(np.uint64(a), np.uint64(b)),
+                                        np.uint64((a * b) >> 64))
+
 
 def test_generator_caching():
     nb_rng = np.random.default_rng(1)
@@ -152,6 +211,23 @@ def test_generator_caching():
     assert np.allclose(np_rng.random(10), numba_func(nb_rng))
 
 
+class CastingGenerator:
+    """
+    Wraps a NumPy Generator so that its methods accept the extra dtype
+    argument supported by Numba, casting the drawn values to it.
+    """
+    def __init__(self, gen):
+        self.gen = gen
+
+    def __getattr__(self, name):
+        func = getattr(self.gen, name)
+
+        def wrapper(*args, dtype=None, **kwargs):
+            res = np.asarray(func(*args, **kwargs)).astype(dtype)
+            return res if res.ndim else res[()]
+        return wrapper
+
+
 class TestRandomGenerators(MemoryLeakMixin, TestCase):
     def check_numpy_parity(self, distribution_func,
                            bitgen_type=None, seed=None,
@@ -284,6 +360,14 @@ class TestRandomGenerators(MemoryLeakMixin, TestCase):
                     self.check_numpy_parity(dist_func, _bitgen,
                                             None, _size, np.bool_, 0)
 
+        # Constant bounds with endpoint=True
+        dist_func = lambda x, size, dtype:\
+            x.integers(-128, 127, size=size, dtype=np.int8, endpoint=True)
+        for _size in test_sizes:
+            with self.subTest(_size=_size):
+                self.check_numpy_parity(dist_func, None,
+                                        None, _size, None, 0)
+
         # Test dtype casting for high and low
         dist_func = lambda x, size, dtype: \
             x.integers(np.uint8(0), np.int64(100))
@@ -348,15 +432,45 @@ class TestRandomGenerators(MemoryLeakMixin, TestCase):
             (0, 0xF - 1, np.int8), # rng == 0xF-1
             (0, 0xF, np.int8), # rng == 0xF
             (-0xF, 0xF, np.int8),
+
+            # rng + 1 is a power of two
+            (0, 2, np.uint64),
+            (3, 3 + 2 ** 20, np.uint64),
+            (0, 2 ** 32, np.uint64),
+            (-2 ** 40, 2 ** 40, np.int64),
+            (0, 2 ** 63, np.uint64),
+            (0, 2 ** 16, np.uint32),
+            (-2 ** 30, 0, np.int32),
+            (0, 2 ** 8, np.uint16),
+            (-2 ** 14, 2 ** 14, np.int16),
+            (0, 2 ** 4, np.uint8),
+            (-2 ** 6, 2 ** 6, np.int8),
         ]
-        size = (2, 3)
+        # Scalar draws take a separate path from the array fills, with
+        # both literal and runtime bounds.
+        scalar_draws = lambda x, low, high, dtype: \
+            [x.integers(low, high, dtype=dtype) for _ in range(10)]
+        scalar_draws_jit = numba.njit(scalar_draws)
 
         for low, high, dtype in cases:
-            with self.subTest(low=low, high=high, dtype=dtype):
-                dist_func = lambda x, size, dtype:\
-                    x.integers(low, high, size=size, dtype=dtype)
-                self.check_numpy_parity(dist_func, None,
-                                        None, size, dtype, 0)
+            for size in [None, (2, 3)]:
+                with self.subTest(low=low, high=high, dtype=dtype,
+                                  size=size):
+                    dist_func = lambda x, size, dtype:\
+                        x.integers(low, high, size=size, dtype=dtype)
+                    self.check_numpy_parity(dist_func, None,
+                                            None, size, dtype, 0)
+            with self.subTest(low=low, high=high, dtype=dtype,
+                              bounds='runtime'):
+                numba_rng = np.random.default_rng(1)
+                numpy_rng = np.random.default_rng(1)
+                got = scalar_draws_jit(numba_rng, dtype(low), dtype(high),
+                                       dtype)
+                expected = scalar_draws(numpy_rng, dtype(low), dtype(high),
+                                        dtype)
+                np.testing.assert_equal(got, expected)
+                self.assertEqual(numba_rng.bit_generator.state,
+                                 numpy_rng.bit_generator.state)
 
     def test_random(self):
         test_sizes = [None, (), (100,), (10, 20, 30)]
@@ -451,6 +565,67 @@ class TestRandomGenerators(MemoryLeakMixin, TestCase):
                         self.check_numpy_parity(dist_func, _bitgen,
                                                 None, _size, _dtype)
 
+    def test_standard_exponential_method(self):
+        # The method is either a compile time literal or a runtime string,
+        # both must select the same underlying implementation.
+        self.disable_leak_check()
+
+        literal_funcs = {
+            'zig': lambda x, size: x.standard_exponential(size=size,
+                                                          method='zig'),
+            'inv': lambda x, size: x.standard_exponential(size=size,
+                                                          method='inv'),
+        }
+        runtime_func = numba.njit(lambda x, size, method:
+                                  x.standard_exponential(size=size,
+                                                         method=method))
+        for _method, _size in itertools.product(['zig', 'inv'],
+                                                [None, (10, 20)]):
+            with self.subTest(_method=_method, _size=_size):
+                expected = literal_funcs[_method](
+                    np.random.default_rng(1), _size)
+                got_literal = numba.njit(literal_funcs[_method])(
+                    np.random.default_rng(1), _size)
+                got_runtime = runtime_func(np.random.default_rng(1),
+                                           _size, _method)
+                np.testing.assert_array_max_ulp(expected, got_literal)
+                np.testing.assert_array_max_ulp(expected, got_runtime)
+
+        invalid_literal = numba.njit(lambda x, size:
+                                     x.standard_exponential(size=size,
+                                                            method='abc'))
+        for _size in [None, (10,)]:
+            with self.subTest(_size=_size):
+                with self.assertRaises(ValueError) as raises:
+                    runtime_func(np.random.default_rng(1), _size, 'abc')
+                self.assertIn("Method must be either 'zig' or 'inv'",
+                              str(raises.exception))
+                with self.assertRaises(ValueError) as raises:
+                    invalid_literal(np.random.default_rng(1), _size)
+                self.assertIn("Method must be either 'zig' or 'inv'",
+                              str(raises.exception))
+
+    def test_ziggurat_fill(self):
+        # Large enough for the array fills to go through the ziggurat
+        # rejection paths many times, the stream must stay in step with
+        # NumPy throughout.
+        dist_funcs = [
+            lambda x, size, dtype: x.standard_normal(size=size, dtype=dtype),
+            lambda x, size, dtype: x.standard_exponential(size=size,
+                                                          dtype=dtype),
+        ]
+        for dist_func, _dtype in itertools.product(dist_funcs,
+                                                   [np.float32, np.float64]):
+            with self.subTest(dist_func=dist_func, _dtype=_dtype):
+                numba_rng = np.random.default_rng(1)
+                numpy_rng = np.random.default_rng(1)
+                got = numba.njit(dist_func)(numba_rng, (20, 5000), _dtype)
+                expected = dist_func(numpy_rng, (20, 5000), _dtype)
+                np.testing.assert_array_max_ulp(expected, got, maxulp=5,
+                                                dtype=_dtype)
+                self.assertEqual(numba_rng.bit_generator.state,
+                                 numpy_rng.bit_generator.state)
+
     def test_standard_gamma(self):
         test_sizes = [None, (), (100,), (10, 20, 30)]
         test_dtypes = [np.float32, np.float64]
@@ -948,6 +1123,89 @@ class TestRandomGenerators(MemoryLeakMixin, TestCase):
         self._check_invalid_types(dist_func, ['n', 'p', 'size'],
                                   [1, 0.75, (1,)], ['x', 'x', ('x',)])
 
+    def check_casting_parity(self, dist_funcs, test_dtypes, ulp_prec):
+        test_sizes = [None, (10, 20)]
+        for dist_func, _size, _dtype in itertools.product(dist_funcs,
+                                                          test_sizes,
+                                                          test_dtypes):
+            with self.subTest(dist_func=dist_func, _size=_size,
+                              _dtype=_dtype):
+                numba_rng_instance = np.random.default_rng(seed=1)
+                numpy_rng_instance = np.random.default_rng(seed=1)
+                numba_res = numba.njit(dist_func)(numba_rng_instance,
+                                                  _size, _dtype)
+                numpy_res = dist_func(CastingGenerator(numpy_rng_instance),
+                                      _size, _dtype)
+                if _size is not None:
+                    self.assertEqual(numba_res.dtype, _dtype)
+                if ulp_prec is None:
+                    np.testing.assert_equal(numba_res, numpy_res)
+                else:
+                    np.testing.assert_array_max_ulp(numpy_res, numba_res,
+                                                    maxulp=ulp_prec,
+                                                    dtype=_dtype)
+                self.assertPreciseEqual(
+                    numba_rng_instance.__getstate__()['state'],
+                    numpy_rng_instance.__getstate__()['state'])
+
+    def test_float_dtype(self):
+        # Numba extends the following distributions with a dtype argument,
+        # the values are drawn as in NumPy and cast to the requested dtype.
+        dist_funcs = [
+            lambda x, size, dtype: x.normal(1.5, 3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.uniform(1.5, 3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.exponential(1.5, size=size, dtype=dtype),
+            lambda x, size, dtype: x.gamma(5.0, 1.5, size=size, dtype=dtype),
+            lambda x, size, dtype: x.beta(1.5, 2.5, size=size, dtype=dtype),
+            lambda x, size, dtype: x.f(2, 3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.chisquare(3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.standard_cauchy(size=size, dtype=dtype),
+            lambda x, size, dtype: x.pareto(1.5, size=size, dtype=dtype),
+            lambda x, size, dtype: x.weibull(1.5, size=size, dtype=dtype),
+            lambda x, size, dtype: x.power(1.5, size=size, dtype=dtype),
+            lambda x, size, dtype: x.laplace(1.5, 3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.logistic(1.5, 3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.lognormal(1.5, 3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.rayleigh(1.5, size=size, dtype=dtype),
+            lambda x, size, dtype: x.standard_t(3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.wald(1.5, 3, size=size, dtype=dtype),
+            lambda x, size, dtype: x.triangular(1.5, 2, 3, size=size,
+                                                dtype=dtype),
+        ]
+        self.check_casting_parity(dist_funcs, [np.float32, np.float64],
+                                  adjusted_ulp_prec)
+
+        dist_func = lambda x, size, dtype:\
+            x.normal(size=size, dtype=dtype)
+        self._check_invalid_types(dist_func, ['size', 'dtype'],
+                                  [(1,), np.float32], [('x',), np.int32])
+
+    def test_int_dtype(self):
+        # As above, for the discrete distributions returning np.int64.
+        dist_funcs = [
+            lambda x, size, dtype: x.geometric(0.1, size=size, dtype=dtype),
+            lambda x, size, dtype: x.zipf(1.5, size=size, dtype=dtype),
+            lambda x, size, dtype: x.poisson(15.0, size=size, dtype=dtype),
+            lambda x, size, dtype: x.negative_binomial(5, 0.1, size=size,
+                                                       dtype=dtype),
+        ]
+        self.check_casting_parity(dist_funcs, [np.int32, np.int64], None)
+
+        # Values past 2**31 wrap around when cast to np.int32, as by astype
+        dist_funcs = [
+            lambda x, size, dtype: x.geometric(1e-10, size=size, dtype=dtype),
+            lambda x, size, dtype: x.zipf(1.1, size=size, dtype=dtype),
+            lambda x, size, dtype: x.poisson(1e10, size=size, dtype=dtype),
+            lambda x, size, dtype: x.negative_binomial(1, 1e-10, size=size,
+                                                       dtype=dtype),
+        ]
+        self.check_casting_parity(dist_funcs, [np.int32], None)
+
+        dist_func = lambda x, size, dtype:\
+            x.poisson(1.0, size=size, dtype=dtype)
+        self._check_invalid_types(dist_func, ['size', 'dtype'],
+                                  [(1,), np.int32], [('x',), np.float64])
+
     # NumPy tests at:
     # https://github.com/numpy/numpy/blob/95e3e7f445407e4f355b23d6a9991d8774f0eb0c/numpy/random/tests/test_generator_mt19937.py#L936
     # Written in following format for semblance with existing Generator tests.
@@ -968,6 +1226,34 @@ class TestRandomGenerators(MemoryLeakMixin, TestCase):
                                         None, _size, None,
                                         0)
 
+        # 1-D arrays are shuffled with scalar swaps
+        for _bitgen, _axis in itertools.product(bitgen_types, [0, -1]):
+            with self.subTest(_bitgen=_bitgen, _axis=_axis):
+                def dist_func(x, size, dtype):
+                    arr = x.integers(0, 1000, size=size)
+                    x.shuffle(arr, axis=_axis)
+                    return arr
+                self.check_numpy_parity(dist_func, _bitgen,
+                                        None, (1000,), None,
+                                        0)
+
+        # 2-D arrays are shuffled with element wise row swaps, including
+        # transposed (non C-contiguous) arrays
+        for _bitgen, _axis, _transpose in itertools.product(bitgen_types,
+                                                            [0, 1, -1],
+                                                            [False, True]):
+            with self.subTest(_bitgen=_bitgen, _axis=_axis,
+                              _transpose=_transpose):
+                def dist_func(x, size, dtype):
+                    arr = x.random(size=size)
+                    if _transpose:
+                        arr = arr.T
+                    x.shuffle(arr, axis=_axis)
+                    return arr
+                self.check_numpy_parity(dist_func, _bitgen,
+                                        None, (40, 50), None,
+                                        0)
+
     def test_shuffle_empty(self):
         a = np.array([])
         b = np.array([])
@@ -981,6 +1267,19 @@ class TestRandomGenerators(MemoryLeakMixin, TestCase):
 
         self.assertPreciseEqual(dist_func(rng(), a), nb_func(rng(), b))
 
+        # Multi-dimensional arrays with an empty shuffled axis
+        def dist_func(x, arr, axis):
+            x.shuffle(arr, axis=axis)
+            return arr
+
+        nb_func = numba.njit(dist_func)
+        for shape, axis in [((0, 3), 0), ((3, 0), 1), ((2, 0, 4), 1)]:
+            with self.subTest(shape=shape, axis=axis):
+                a = np.empty(shape)
+                b = np.empty(shape)
+                self.assertPreciseEqual(dist_func(rng(), a, axis),
+                                        nb_func(rng(), b, axis))
+
     def test_shuffle_check(self):
         self.disable_leak_check()
 
@@ -1018,6 +1317,14 @@ class TestRandomGenerators(MemoryLeakMixin, TestCase):
                                         None, _size, None,
                                         0)
 
+        # Test permutation of an integer (a shuffled np.arange)
+        for _bitgen, _n in itertools.product(bitgen_types, [0, 1, 1000]):
+            with self.subTest(_bitgen=_bitgen, _n=_n):
+                dist_func = lambda x, size, dtype: x.permutation(size)
+                self.check_numpy_parity(dist_func, _bitgen,
+                                        None, _n, None,
+                                        0)
+
         # Test that permutation is actually done on a copy of the array
         dist_func = numba.njit(lambda rng, arr: rng.permutation(arr))
         rng = np.random.default_rng()
@@ -1181,6 +1488,44 @@ class TestRandomGenerators(MemoryLeakMixin, TestCase):
         self.disable_leak_check()
 
 
+class TestGeneratorParallel(MemoryLeakMixin, TestCase):
+    @skip_parfors_unsupported
+    def test_generators_prange(self):
+        # Independent streams are used in parallel by passing a typed List
+        # with one Generator per stream, each only ever touched by one
+        # iteration.
+        def draw(gens, size):
+            n = len(gens)
+            out = np.empty((n, 3, size))
+            for i in numba.prange(n):
+                # The prange index is unsigned, indexing the List with it
+                # directly emits a NumbaTypeSafetyWarning.
+                gen = gens[np.intp(i)]
+                out[i, 0] = gen.random(size)
+                out[i, 1] = gen.standard_normal(size)
+                out[i, 2] = gen.integers(0, 100, size)
+            return out
+
+        parallel_draw = numba.njit(parallel=True)(draw)
+        n_streams, size = 8, 1000
+
+        def make_generators():
+            seeds = np.random.SeedSequence(1).spawn(n_streams)
+            return [np.random.default_rng(s) for s in seeds]
+
+        numba_gens = make_generators()
+        numpy_gens = make_generators()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            got = parallel_draw(List(numba_gens), size)
+        self.assertEqual(w, [])
+        expected = draw(numpy_gens, size)
+        np.testing.assert_array_max_ulp(expected, got, maxulp=5)
+        for numba_gen, numpy_gen in zip(numba_gens, numpy_gens):
+            self.assertEqual(numba_gen.bit_generator.state,
+                             numpy_gen.bit_generator.state)
+
+
 class TestGeneratorCaching(TestCase, SerialMixin):
     def test_randomgen_caching(self):
         nb_rng = np.random.default_rng(1)